@@ -858,8 +858,8 @@ def analyze_graphs(graph_files: List[str], output_path: Optional[str] = None, fo
     write_output(results, output_path, format)
 
 
-def parse_args():
-    """Parse command-line arguments"""
+def parse_args(argv: Optional[List[str]] = None):
+    """Parse command-line arguments (defaults to sys.argv[1:])"""
     parser = argparse.ArgumentParser(
         description='Causality analysis for system architectures (correlation vs causation)',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -909,7 +909,7 @@ These are hypotheses, not proven facts. Always validate before assuming causatio
         help='Run demonstration with hardcoded test data'
     )
 
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
 def demo():
@@ -979,9 +979,9 @@ def demo():
     print("\n" + report)
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """Main entry point - handles CLI arguments or runs demo"""
-    args = parse_args()
+    args = parse_args(argv)
 
     if args.demo:
         # Run demo with hardcoded test data
@@ -807,8 +807,8 @@ def analyze_graphs(
     write_output(results, output_path, format)
 
 
-def parse_args():
-    """Parse command-line arguments"""
+def parse_args(argv: Optional[List[str]] = None):
+    """Parse command-line arguments (defaults to sys.argv[1:])"""
     parser = argparse.ArgumentParser(
         description='Creative linking for orthogonal/cross-domain architectures',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -868,7 +868,7 @@ AI-generated metaphors should be reviewed by domain experts.
         help='Run demonstration with hardcoded test data'
     )
 
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
 def demo():
@@ -919,9 +919,9 @@ def demo():
     print(report)
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """Main entry point - handles CLI arguments or runs demo"""
-    args = parse_args()
+    args = parse_args(argv)
 
     if args.demo:
         # Run demo with hardcoded test data
@@ -4,13 +4,17 @@ Interactive Workflow Executor for Chain Reflow
 Handles user interaction and LLM-guided workflow execution
 """
 
-import json
 import os
 import sys
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+from json_io import dump_json, load_json
+
+_SEP = "=" * 70
+_DASH = "-" * 70
+
 
 class InteractiveExecutor:
     """Interactive workflow executor with user prompts and guidance"""
@@ -20,6 +24,7 @@ class InteractiveExecutor:
         self.system_root = Path(system_root) if system_root else Path.cwd()
         self.context_dir = self.system_root / "context"
         self.workflow_data = None
+        self.metadata = {}
         self.working_memory = {}
         self.framework_selected = None
 
@@ -28,8 +33,8 @@ class InteractiveExecutor:
 
     def _load_workflow(self):
         """Load workflow JSON"""
-        with open(self.workflow_file, 'r') as f:
-            self.workflow_data = json.load(f)
+        self.workflow_data = load_json(self.workflow_file)
+        self.metadata = self.workflow_data['workflow_metadata']
 
     def _init_context(self):
         """Initialize context directory"""
@@ -37,13 +42,12 @@ class InteractiveExecutor:
 
         working_memory_file = self.context_dir / "working_memory.json"
         if working_memory_file.exists():
-            with open(working_memory_file, 'r') as f:
-                self.working_memory = json.load(f)
+            self.working_memory = load_json(working_memory_file)
         else:
             self.working_memory = {
                 "system_name": None,
-                "workflow_id": self.workflow_data['workflow_metadata']['workflow_id'],
-                "workflow_version": self.workflow_data['workflow_metadata']['version'],
+                "workflow_id": self.metadata['workflow_id'],
+                "workflow_version": self.metadata['version'],
                 "started_at": datetime.now().isoformat(),
                 "paths": {
                     "system_root": str(self.system_root.absolute()),
@@ -61,22 +65,21 @@ class InteractiveExecutor:
     def _save_working_memory(self):
         """Save working memory"""
         working_memory_file = self.context_dir / "working_memory.json"
-        with open(working_memory_file, 'w') as f:
-            json.dump(self.working_memory, f, indent=2)
+        dump_json(working_memory_file, self.working_memory)
 
     def run_step_s01_path_configuration(self):
         """Execute S-01: Path Configuration"""
-        print("\n" + "="*70)
+        print("\n" + _SEP)
         print("STEP S-01: Path Configuration")
-        print("="*70)
+        print(_SEP)
         print("\nThis step configures all required paths for workflow operation.")
         print("\nPath configuration is critical for tool invocations.")
         print("All paths must be absolute for proper operation.\n")
 
         # S-01-A01: Identify reflow_root
-        print("-" * 70)
+        print(_DASH)
         print("Action S-01-A01: Identify and validate reflow_root path")
-        print("-" * 70)
+        print(_DASH)
 
         reflow_root = input("\nEnter the path to reflow installation (reflow_root): ").strip()
         reflow_root = Path(reflow_root).absolute()
@@ -96,9 +99,9 @@ class InteractiveExecutor:
         self.working_memory['paths']['reflow_root'] = str(reflow_root)
 
         # S-01-A02: Identify system_root
-        print("\n" + "-" * 70)
+        print("\n" + _DASH)
         print("Action S-01-A02: Identify or create system_root path")
-        print("-" * 70)
+        print(_DASH)
 
         print(f"\nCurrent system_root: {self.system_root}")
         use_current = input("Use current directory as system_root? [Y/n]: ").strip().lower()
@@ -113,9 +116,9 @@ class InteractiveExecutor:
         self.working_memory['paths']['system_root'] = str(system_root)
 
         # S-01-A03: Derive tool paths
-        print("\n" + "-" * 70)
+        print("\n" + _DASH)
         print("Action S-01-A03: Derive and store all tool paths")
-        print("-" * 70)
+        print(_DASH)
 
         self.working_memory['paths']['tools_path'] = str(reflow_root / "tools")
         self.working_memory['paths']['templates_path'] = str(reflow_root / "templates")
@@ -131,24 +134,24 @@ class InteractiveExecutor:
         print("\n✓ Path configuration saved to context/working_memory.json")
 
         # S-01-A04: Validation (simulated)
-        print("\n" + "-" * 70)
+        print("\n" + _DASH)
         print("Action S-01-A04: Run validation (simulated)")
-        print("-" * 70)
+        print(_DASH)
         print(f"\nWould execute: python3 {reflow_root}/tools/validate_reflow_setup.py {system_root}")
         print("✓ Path configuration complete")
 
     def run_step_s01a_framework_selection(self):
         """Execute S-01A: Architectural Framework Selection"""
-        print("\n" + "="*70)
+        print("\n" + _SEP)
         print("STEP S-01A: Architectural Framework Selection")
-        print("="*70)
+        print(_SEP)
         print("\nFramework selection is an ARCHITECTURAL DECISION.")
         print("The wrong framework leads to wrong insights.\n")
 
         # S-01A-A01: System characteristics analysis
-        print("-" * 70)
+        print(_DASH)
         print("Action S-01A-A01: Analyze system domain and characteristics")
-        print("-" * 70)
+        print(_DASH)
 
         print("\nSemantic Matching Questionnaire:")
         print("\nThis questionnaire helps match your system to the appropriate framework.")
@@ -199,9 +202,9 @@ class InteractiveExecutor:
         framework_recommendation = self._recommend_framework(q1, q2, q3, q4)
 
         # S-01A-A04 & A05: Present recommendation and get confirmation
-        print("\n" + "-" * 70)
+        print("\n" + _DASH)
         print("Framework Recommendation")
-        print("-" * 70)
+        print(_DASH)
 
         print(f"\nRecommended: {framework_recommendation['name']}")
         print(f"\nRationale: {framework_recommendation['rationale']}")
@@ -332,9 +335,9 @@ class InteractiveExecutor:
 
     def run_step_s02_directory_structure(self):
         """Execute S-02: Directory Structure Creation"""
-        print("\n" + "="*70)
+        print("\n" + _SEP)
         print("STEP S-02: Directory Structure Creation")
-        print("="*70)
+        print(_SEP)
 
         required_dirs = ["context", "specs", "services", "docs", "architectures"]
 
@@ -348,18 +351,18 @@ class InteractiveExecutor:
 
     def run_step_s03_foundational_documents(self):
         """Execute S-03: Foundational Documents"""
-        print("\n" + "="*70)
+        print("\n" + _SEP)
         print("STEP S-03: Foundational Documents")
-        print("="*70)
+        print(_SEP)
 
         # Get system name
         system_name = input("\nEnter system name: ").strip()
         self.working_memory['system_name'] = system_name
 
         # Mission statement
-        print("\n" + "-" * 70)
+        print("\n" + _DASH)
         print("Creating Mission Statement")
-        print("-" * 70)
+        print(_DASH)
 
         mission = input("\nEnter mission statement (or press Enter for guided creation): ").strip()
 
@@ -380,9 +383,9 @@ class InteractiveExecutor:
         print(f"\n✓ Mission statement saved to: {mission_file}")
 
         # User scenarios
-        print("\n" + "-" * 70)
+        print("\n" + _DASH)
         print("Creating User Scenarios")
-        print("-" * 70)
+        print(_DASH)
 
         scenarios = []
         while True:
@@ -401,9 +404,9 @@ class InteractiveExecutor:
         print(f"✓ User scenarios saved to: {scenarios_file}")
 
         # Success criteria
-        print("\n" + "-" * 70)
+        print("\n" + _DASH)
         print("Creating Success Criteria")
-        print("-" * 70)
+        print(_DASH)
 
         criteria = []
         while True:
@@ -427,11 +430,11 @@ class InteractiveExecutor:
 
     def run(self):
         """Run the complete setup workflow interactively"""
-        print("\n" + "="*70)
-        print(f"Chain Reflow - {self.workflow_data['workflow_metadata']['name']}")
-        print("="*70)
-        print(f"\n{self.workflow_data['workflow_metadata']['description']}\n")
-        print(f"Version: {self.workflow_data['workflow_metadata']['version']}")
+        print("\n" + _SEP)
+        print(f"Chain Reflow - {self.metadata['name']}")
+        print(_SEP)
+        print(f"\n{self.metadata['description']}\n")
+        print(f"Version: {self.metadata['version']}")
         print(f"System Root: {self.system_root}\n")
 
         input("Press Enter to begin...")
@@ -442,9 +445,9 @@ class InteractiveExecutor:
         self.run_step_s02_directory_structure()
         self.run_step_s03_foundational_documents()
 
-        print("\n" + "="*70)
+        print("\n" + _SEP)
         print("Setup Workflow Complete!")
-        print("="*70)
+        print(_SEP)
         print(f"\nSystem: {self.working_memory.get('system_name', 'N/A')}")
         print(f"Framework: {self.working_memory['framework_configuration'].get('framework_name', 'N/A')}")
         print(f"Root: {self.system_root}")
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+JSON I/O shared by the Chain Reflow tools
+
+Uses orjson when it is installed and the stdlib json module otherwise.
+Either way, serialized output is ASCII-only (non-ASCII text is \\u-escaped,
+as json.dumps does by default) and parses back to the same values:
+NaN and Infinity, which orjson would write as null, go through json.dumps,
+and input orjson rejects (such as NaN literals) is re-parsed with json.
+The bytes are not always identical, since orjson spells some floats
+differently (1e-05 as 0.00001, 1e+16 as 1e16).
+"""
+
+import json
+import math
+from pathlib import Path
+from typing import Any, Optional, Union
+
+try:
+    import orjson  # Optional: faster JSON parsing/serialization
+except ImportError:
+    orjson = None
+
+
+def _has_non_finite(data: Any) -> bool:
+    """Check whether data holds a NaN or infinite float anywhere"""
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
+
+def _orjson_dumps(data: Any, indent: bool) -> Optional[bytes]:
+    """orjson encoding of data, or None where json.dumps must be used instead"""
+    try:
+        encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    except TypeError:
+        return None  # e.g. non-string keys or out-of-range ints
+    if not encoded.isascii():
+        return None  # json.dumps escapes non-ASCII text
+    if b'null' in encoded and _has_non_finite(data):
+        return None  # orjson writes NaN/Infinity as null
+    return encoded
+
+
+def _stdlib_dumps(data: Any, indent: bool) -> str:
+    """json.dumps encoding of data, indented by 2 or compact"""
+    if indent:
+        return json.dumps(data, indent=2)
+    return json.dumps(data, separators=(',', ':'))
+
+
+def load_json(path: Union[str, Path]) -> Any:
+    """Parse a JSON file"""
+    if orjson is not None:
+        raw = Path(path).read_bytes()
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            return json.loads(raw)  # Also accepts NaN/Infinity literals
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def dumps_json(data: Any, indent: bool = True) -> str:
+    """Serialize data to an ASCII JSON string, indented by 2 unless indent=False"""
+    if orjson is not None:
+        encoded = _orjson_dumps(data, indent)
+        if encoded is not None:
+            return encoded.decode('ascii')
+    return _stdlib_dumps(data, indent)
+
+
+def dump_json(path: Union[str, Path], data: Any, indent: bool = True):
+    """
+    Write data to a JSON file (see dumps_json)
+
+    orjson's bytes are written as-is, without a round trip through str.
+    """
+    if orjson is not None:
+        encoded = _orjson_dumps(data, indent)
+        if encoded is not None:
+            Path(path).write_bytes(encoded)
+            return
+    Path(path).write_text(_stdlib_dumps(data, indent), encoding='ascii')
@@ -43,9 +43,9 @@ Mathematical Approach:
 """
 
 import json
+import os
 import sys
 import argparse
-import numpy as np
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, asdict
@@ -53,6 +53,44 @@ from datetime import datetime
 from enum import Enum
 
 
+# Environment variables honoured by the common BLAS/LAPACK backends
+BLAS_THREAD_VARS = ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS')
+
+
+def limit_blas_threads(num_threads: int):
+    """
+    Cap the number of threads used by BLAS/LAPACK (SVD, pinv, eig).
+
+    Backends read these variables once, when numpy is first imported, so
+    this has no effect on a process that has already imported numpy.
+    """
+    for var in BLAS_THREAD_VARS:
+        os.environ[var] = str(num_threads)
+
+
+def _threads_from_argv(argv: List[str]) -> Optional[int]:
+    """Pick a valid --threads value out of the command line, ahead of main()"""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument('--threads')
+    args, _ = parser.parse_known_args(argv)
+    try:
+        threads = int(args.threads)
+    except (TypeError, ValueError):
+        return None  # Absent or invalid; main() reports bad values
+    return threads if threads >= 1 else None
+
+
+# --threads must be applied before numpy loads its BLAS backend. When run
+# as a script that happens here; main() warns if it could not.
+_PRESET_THREADS = None
+if __name__ == "__main__" and 'numpy' not in sys.modules:
+    _PRESET_THREADS = _threads_from_argv(sys.argv[1:])
+    if _PRESET_THREADS is not None:
+        limit_blas_threads(_PRESET_THREADS)
+
+import numpy as np  # noqa: E402 (after the BLAS thread setup above)
+
+
 class SystemType(Enum):
     """Types of systems in ecological/engineered contexts"""
     ECOLOGICAL = "ecological"
@@ -62,7 +100,6 @@ class SystemType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
 class GraphSystem:
     """
     Represent a system-of-systems as graph matrices.
@@ -71,22 +108,42 @@ class GraphSystem:
     - Adjacency matrix: Node-to-node connections and weights
     - Node states: Current state of each component
     - Metadata: System properties and classifications
-    """
-    name: str
-    nodes: List[str]
-    adjacency: np.ndarray = None
-    node_states: np.ndarray = None
-    metadata: Dict[str, Any] = None
 
-    def __post_init__(self):
+    Uses __slots__ instead of a per-instance __dict__ to keep the memory
+    footprint of each loaded graph small (dataclass(slots=True) needs 3.10+).
+    """
+    __slots__ = ('name', 'nodes', 'adjacency', 'node_states', 'metadata')
+
+    def __init__(self,
+                 name: str,
+                 nodes: List[str],
+                 adjacency: Optional[np.ndarray] = None,
+                 node_states: Optional[np.ndarray] = None,
+                 metadata: Optional[Dict[str, Any]] = None):
         """Initialize matrices if not provided"""
-        n = len(self.nodes)
-        if self.adjacency is None:
-            self.adjacency = np.zeros((n, n))
-        if self.node_states is None:
-            self.node_states = np.zeros(n)
-        if self.metadata is None:
-            self.metadata = {}
+        self.name = name
+        self.nodes = nodes
+        n = len(nodes)
+        self.adjacency = adjacency if adjacency is not None else np.zeros((n, n))
+        self.node_states = node_states if node_states is not None else np.zeros(n)
+        self.metadata = metadata if metadata is not None else {}
+
+    # __slots__ rules out @dataclass on 3.8, so keep its repr/eq by hand
+    def __repr__(self) -> str:
+        return (f"GraphSystem(name={self.name!r}, nodes={self.nodes!r}, "
+                f"adjacency={self.adjacency!r}, node_states={self.node_states!r}, "
+                f"metadata={self.metadata!r})")
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.name == other.name
+                and self.nodes == other.nodes
+                and np.array_equal(self.adjacency, other.adjacency)
+                and np.array_equal(self.node_states, other.node_states)
+                and self.metadata == other.metadata)
+
+    __hash__ = None  # Mutable and compared by value, as with @dataclass
 
     @property
     def n(self) -> int:
@@ -882,6 +939,12 @@ Examples:
 
   # Single-layer analysis (no decomposition)
   python3 matrix_gap_detection.py sys_a.json sys_c.json --no-multilayer
+
+  # Limit LAPACK to 2 threads (avoids oversubscription in CI)
+  python3 matrix_gap_detection.py sys_a.json sys_c.json --threads 2
+
+  # Profile the analysis (writes missing_system.prof)
+  python3 matrix_gap_detection.py sys_a.json sys_c.json -o missing_system.json --profile
         """
     )
 
@@ -899,11 +962,29 @@ Examples:
                        help='Disable multi-layer decomposition')
     parser.add_argument('--verbose', '-v', action='store_true',
                        help='Verbose output')
+    parser.add_argument('--threads', type=int, default=None,
+                       help='Number of BLAS/LAPACK threads for the solver (default: library choice)')
+    parser.add_argument('--profile', action='store_true',
+                       help='Profile the analysis and write stats next to --output as .prof')
 
     parser.set_defaults(multilayer=True)
 
     args = parser.parse_args()
 
+    # Dump tracebacks on hard crashes (e.g. SIGSEGV inside LAPACK)
+    if args.verbose:
+        import faulthandler
+        faulthandler.enable()
+
+    if args.threads is not None:
+        if args.threads < 1:
+            print(f"Error: --threads must be >= 1 (got {args.threads})", file=sys.stderr)
+            sys.exit(1)
+        if args.threads != _PRESET_THREADS:
+            print("Warning: --threads has no effect, numpy was imported before it "
+                  "could be applied; set " + "/".join(BLAS_THREAD_VARS) +
+                  " in the environment instead", file=sys.stderr)
+
     # Validate inputs
     if not args.system_a.exists():
         print(f"Error: System A file not found: {args.system_a}", file=sys.stderr)
@@ -914,23 +995,37 @@ Examples:
         sys.exit(1)
 
     try:
-        results = detect_missing_systems(
-            args.system_a,
-            args.system_c,
+        analysis_kwargs = dict(
             output_path=args.output,
             format_type=args.format,
             multilayer=args.multilayer,
             verbose=args.verbose
         )
 
+        if args.profile:
+            # On Python 3.12+ cProfile is built on PEP 669 (sys.monitoring)
+            import cProfile
+            profiler = cProfile.Profile()
+            results = profiler.runcall(
+                detect_missing_systems, args.system_a, args.system_c, **analysis_kwargs
+            )
+            profile_path = (args.output or Path("matrix_gap_detection")).with_suffix('.prof')
+            profiler.dump_stats(str(profile_path))
+            print(f"Profile written to: {profile_path}", file=sys.stderr)
+        else:
+            results = detect_missing_systems(args.system_a, args.system_c, **analysis_kwargs)
+
         # Exit successfully
         sys.exit(0)
 
     except Exception as e:
-        print(f"Error during analysis: {e}", file=sys.stderr)
+        # Assemble the full error report and emit it with a single write
+        msg = f"Error during analysis: {e}\n"
         if args.verbose:
             import traceback
-            traceback.print_exc()
+            msg += traceback.format_exc()
+        sys.stderr.write(msg)
+        sys.stderr.flush()
         sys.exit(1)
 
 
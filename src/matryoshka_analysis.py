@@ -30,11 +30,18 @@ Relationships:
 import json
 import sys
 import argparse
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple, Set
-from dataclasses import dataclass, asdict
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple, Set
+from dataclasses import dataclass
 from enum import Enum
-from datetime import datetime
+
+from json_io import dumps_json, load_json
+
+try:
+    import ahocorasick  # Optional: pyahocorasick multi-pattern keyword matcher
+except ImportError:
+    ahocorasick = None
 
 
 class HierarchyLevel(Enum):
@@ -56,9 +63,45 @@ class RelationshipType(Enum):
     UNRELATED = "unrelated"  # No hierarchical relationship
 
 
+# Enum values bound once for use in analysis and report loops
+_REL_PEER = RelationshipType.PEER.value
+_REL_PC = RelationshipType.PARENT_CHILD.value
+_REL_CP = RelationshipType.CHILD_PARENT.value
+_REL_NESTED = RelationshipType.NESTED_INDIRECT.value
+_REL_UNREL = RelationshipType.UNRELATED.value
+_LEVEL_ENTERPRISE = HierarchyLevel.ENTERPRISE.value
+_LEVEL_UNKNOWN = HierarchyLevel.UNKNOWN.value
+
+# Report separators
+_SEP = "=" * 70
+_DASH = "-" * 70
+
+# Relationship types reported as direct containment
+_PARENT_CHILD_TYPES = frozenset({_REL_PC, _REL_CP})
+
+_EMPTY_INDEX = frozenset()
+
+
+@dataclass(frozen=True)
+class LevelSpec:
+    """Precompiled scoring indicators for one hierarchy level"""
+    __slots__ = ('level', 'min_count', 'max_count', 'keywords', 'scope')
+
+    level: HierarchyLevel
+    min_count: int
+    max_count: float
+    keywords: Tuple[str, ...]  # Lowercased, in match priority order
+    scope: str
+
+
 @dataclass
 class HierarchyMetadata:
     """Metadata about an architecture's position in hierarchy"""
+    __slots__ = (
+        'architecture_name', 'declared_level', 'inferred_level',
+        'confidence', 'evidence', 'scope_indicators'
+    )
+
     architecture_name: str
     declared_level: Optional[str]  # User-specified level
     inferred_level: str  # System-inferred level
@@ -67,12 +110,25 @@ class HierarchyMetadata:
     scope_indicators: Dict[str, Any]  # Size, complexity, etc.
 
     def to_dict(self):
-        return asdict(self)
+        return {
+            'architecture_name': self.architecture_name,
+            'declared_level': self.declared_level,
+            'inferred_level': self.inferred_level,
+            'confidence': self.confidence,
+            'evidence': list(self.evidence),
+            'scope_indicators': dict(self.scope_indicators)
+        }
 
 
 @dataclass
 class NestingRelationship:
     """Represents a parent-child nesting relationship"""
+    __slots__ = (
+        'id', 'parent_architecture', 'child_architecture', 'parent_level',
+        'child_level', 'relationship_type', 'evidence', 'confidence',
+        'direct_containment'
+    )
+
     id: str
     parent_architecture: str
     child_architecture: str
@@ -84,12 +140,27 @@ class NestingRelationship:
     direct_containment: bool  # True if parent directly contains child
 
     def to_dict(self):
-        return asdict(self)
+        return {
+            'id': self.id,
+            'parent_architecture': self.parent_architecture,
+            'child_architecture': self.child_architecture,
+            'parent_level': self.parent_level,
+            'child_level': self.child_level,
+            'relationship_type': self.relationship_type,
+            'evidence': list(self.evidence),
+            'confidence': self.confidence,
+            'direct_containment': self.direct_containment
+        }
 
 
 @dataclass
 class HierarchicalGap:
     """Represents a missing intermediate level in the hierarchy"""
+    __slots__ = (
+        'id', 'architecture_a', 'architecture_b', 'level_a', 'level_b',
+        'missing_level', 'hypothesis', 'evidence', 'gap_type'
+    )
+
     id: str
     architecture_a: str
     architecture_b: str
@@ -101,7 +172,17 @@ class HierarchicalGap:
     gap_type: str  # "missing_parent", "missing_intermediate", "missing_peer"
 
     def to_dict(self):
-        return asdict(self)
+        return {
+            'id': self.id,
+            'architecture_a': self.architecture_a,
+            'architecture_b': self.architecture_b,
+            'level_a': self.level_a,
+            'level_b': self.level_b,
+            'missing_level': self.missing_level,
+            'hypothesis': self.hypothesis,
+            'evidence': list(self.evidence),
+            'gap_type': self.gap_type
+        }
 
 
 class MatryoshkaAnalyzer:
@@ -119,6 +200,10 @@ class MatryoshkaAnalyzer:
             HierarchyLevel.ENTERPRISE
         ]
 
+        # Level value lookups, computed once instead of per comparison
+        self._level_values = tuple(level.value for level in self.hierarchy_order)
+        self._level_index = {value: i for i, value in enumerate(self._level_values)}
+
         # Scope indicators for each level
         self.level_indicators = {
             HierarchyLevel.COMPONENT: {
@@ -153,6 +238,21 @@ class MatryoshkaAnalyzer:
             }
         }
 
+        # level_indicators is frozen here: scoring uses these precompiled specs,
+        # so later edits to the dict are not picked up
+        self._levels_fast: List[LevelSpec] = []
+        for level in self.hierarchy_order:
+            indicators = self.level_indicators[level]
+            min_count, max_count = indicators['typical_component_count']
+            self._levels_fast.append(LevelSpec(
+                level=level,
+                min_count=min_count,
+                max_count=max_count,
+                keywords=tuple(keyword.lower() for keyword in indicators['keywords']),
+                scope=indicators['scope']
+            ))
+        self._match_keywords = self._keyword_matcher(self._levels_fast)
+
     def infer_hierarchy_level(
         self,
         arch: Dict[str, Any]
@@ -167,6 +267,69 @@ class MatryoshkaAnalyzer:
         - Scope description
         - Domain hints
         """
+        return self._infer_level(arch)
+
+    def infer_all_hierarchy_levels(
+        self,
+        architectures: List[Dict[str, Any]]
+    ) -> Dict[str, HierarchyMetadata]:
+        """
+        Infer hierarchy levels for a batch of architectures
+
+        Same result as calling infer_hierarchy_level for each architecture,
+        returned as a name-keyed mapping.
+
+        Returns: Mapping of architecture name to HierarchyMetadata
+        """
+        return {arch['name']: self._infer_level(arch) for arch in architectures}
+
+    def _keyword_matcher(
+        self,
+        level_specs: List[LevelSpec]
+    ) -> Callable[[str], Dict[int, str]]:
+        """
+        Build a function mapping text to {level position: matched keyword}
+
+        For each level, the matched keyword is the first one (in list order)
+        that occurs in the text. With pyahocorasick installed, all levels are
+        matched in a single automaton pass; otherwise keywords are scanned
+        per level with substring checks.
+        """
+        owners: Dict[str, List[Tuple[int, int]]] = {}
+        for pos, spec in enumerate(level_specs):
+            for rank, keyword in enumerate(spec.keywords):
+                owners.setdefault(keyword, []).append((pos, rank))
+
+        if ahocorasick is None or not owners:
+            def match_keywords(text: str) -> Dict[int, str]:
+                hits = {}
+                for pos, spec in enumerate(level_specs):
+                    for keyword in spec.keywords:
+                        if keyword in text:
+                            hits[pos] = keyword
+                            break
+                return hits
+
+            return match_keywords
+
+        automaton = ahocorasick.Automaton()
+        for keyword, keyword_owners in owners.items():
+            automaton.add_word(keyword, (keyword, keyword_owners))
+        automaton.make_automaton()
+
+        def match_keywords(text: str) -> Dict[int, str]:
+            best: Dict[int, Tuple[int, str]] = {}
+            for _, (keyword, keyword_owners) in automaton.iter(text):
+                for pos, rank in keyword_owners:
+                    current = best.get(pos)
+                    if current is None or rank < current[0]:
+                        best[pos] = (rank, keyword)
+            return {pos: keyword for pos, (_, keyword) in best.items()}
+
+        return match_keywords
+
+    def _infer_level(self, arch: Dict[str, Any]) -> HierarchyMetadata:
+        """Score an architecture against every precompiled level spec"""
         arch_name = arch.get('name', 'Unknown')
         declared_level = arch.get('hierarchy_level')
 
@@ -181,58 +344,67 @@ class MatryoshkaAnalyzer:
                 scope_indicators=self._extract_scope_indicators(arch)
             )
 
-        # Otherwise, infer from indicators
-        scores = {}
-        evidence = []
+        # Otherwise, infer from indicators, keeping a running best (first level wins ties)
+        best_pos = None
+        best_score = -1.0
 
         component_count = len(arch.get('components', []))
         name_lower = arch_name.lower()
         description_lower = arch.get('description', '').lower()
+        scope = arch.get('scope', '')
+        scope_lower = scope.lower() if scope else ''
 
-        for level in self.hierarchy_order:
+        # Keyword hits for every level, one matcher pass per field
+        name_hits = self._match_keywords(name_lower)
+        description_hits = self._match_keywords(description_lower)
+
+        for pos, spec in enumerate(self._levels_fast):
             score = 0.0
-            level_evidence = []
-            indicators = self.level_indicators[level]
 
             # Check component count
-            min_count, max_count = indicators['typical_component_count']
-            if min_count <= component_count <= max_count:
+            if spec.min_count <= component_count <= spec.max_count:
                 score += 0.4
-                level_evidence.append(f"Component count ({component_count}) matches {level.value} range")
+
+            # Bound: skip the level if even every remaining indicator
+            # cannot lift it strictly above the current best
+            if score + 0.3 + 0.2 + 0.1 <= best_score:
+                continue
 
             # Check keywords in name
-            for keyword in indicators['keywords']:
-                if keyword in name_lower:
-                    score += 0.3
-                    level_evidence.append(f"Name contains '{keyword}' keyword")
-                    break
+            if pos in name_hits:
+                score += 0.3
 
             # Check keywords in description
-            for keyword in indicators['keywords']:
-                if keyword in description_lower:
-                    score += 0.2
-                    level_evidence.append(f"Description contains '{keyword}' keyword")
-                    break
+            if pos in description_hits:
+                score += 0.2
 
             # Check scope
-            scope = arch.get('scope', '')
-            if scope and scope.lower() == indicators['scope']:
+            if scope_lower and scope_lower == spec.scope:
                 score += 0.1
-                level_evidence.append(f"Scope matches: {scope}")
-
-            scores[level] = score
-            if level_evidence:
-                evidence.extend([(level, ev) for ev in level_evidence])
 
-        # Select level with highest score
-        best_level = max(scores, key=scores.get)
-        best_score = scores[best_level]
-        best_evidence = [ev for level, ev in evidence if level == best_level]
+            if score > best_score:
+                best_pos = pos
+                best_score = score
 
         # If no clear winner, mark as unknown
         if best_score < 0.3:
             best_level = HierarchyLevel.UNKNOWN
             best_evidence = ["Insufficient evidence to determine hierarchy level"]
+        else:
+            # Evidence strings are only formatted for the winning level
+            spec = self._levels_fast[best_pos]
+            best_level = spec.level
+            best_evidence = []
+            if spec.min_count <= component_count <= spec.max_count:
+                best_evidence.append(f"Component count ({component_count}) matches {best_level.value} range")
+            keyword = name_hits.get(best_pos)
+            if keyword is not None:
+                best_evidence.append(f"Name contains '{keyword}' keyword")
+            keyword = description_hits.get(best_pos)
+            if keyword is not None:
+                best_evidence.append(f"Description contains '{keyword}' keyword")
+            if scope_lower and scope_lower == spec.scope:
+                best_evidence.append(f"Scope matches: {scope}")
 
         return HierarchyMetadata(
             architecture_name=arch_name,
@@ -269,14 +441,64 @@ class MatryoshkaAnalyzer:
         - Parent-child (one contains the other)
         - Nested through intermediates
         """
+        return self._relationship(
+            arch_a, arch_b, metadata_a, metadata_b,
+            self._level_index.get(metadata_a.inferred_level),
+            self._level_index.get(metadata_b.inferred_level),
+            self._subarch_index(arch_a),
+            self._subarch_index(arch_b)
+        )
+
+    def analyze_all_relationships(
+        self,
+        architectures: List[Dict[str, Any]],
+        hierarchy_metadata: Dict[str, HierarchyMetadata]
+    ) -> List[NestingRelationship]:
+        """
+        Analyze relationships across a set of architectures
+
+        Every pair is analyzed, in the same order as calling
+        analyze_relationship on each (a, b) pair with a before b.
+        """
+        # Resolve metadata, level index and subarchitecture index once per
+        # architecture, not per pair
+        metas = [hierarchy_metadata[arch['name']] for arch in architectures]
+        level_ids = [self._level_index.get(meta.inferred_level) for meta in metas]
+        subarchs = [self._subarch_index(arch) for arch in architectures]
+
+        relationships = []
+        for i, arch_a in enumerate(architectures):
+            meta_a = metas[i]
+            idx_a = level_ids[i]
+            subarchs_a = subarchs[i]
+            for j in range(i + 1, len(architectures)):
+                relationships.append(self._relationship(
+                    arch_a, architectures[j], meta_a, metas[j], idx_a, level_ids[j],
+                    subarchs_a, subarchs[j]
+                ))
+        return relationships
+
+    def _relationship(
+        self,
+        arch_a: Dict[str, Any],
+        arch_b: Dict[str, Any],
+        metadata_a: HierarchyMetadata,
+        metadata_b: HierarchyMetadata,
+        idx_a: Optional[int],
+        idx_b: Optional[int],
+        subarchs_a: Tuple[frozenset, frozenset],
+        subarchs_b: Tuple[frozenset, frozenset]
+    ) -> NestingRelationship:
+        """
+        Relationship between two architectures with levels already resolved
+
+        idx_a/idx_b are hierarchy_order positions (None = unknown level) and
+        subarchs_a/subarchs_b are each side's subarchitecture (names, ids) index.
+        """
         level_a = metadata_a.inferred_level
         level_b = metadata_b.inferred_level
 
-        # Get level indices
-        try:
-            idx_a = [l.value for l in self.hierarchy_order].index(level_a)
-            idx_b = [l.value for l in self.hierarchy_order].index(level_b)
-        except ValueError:
+        if idx_a is None or idx_b is None:
             # One or both levels are unknown
             return NestingRelationship(
                 id=f"rel_{arch_a['name']}_{arch_b['name']}",
@@ -284,7 +506,7 @@ class MatryoshkaAnalyzer:
                 child_architecture="unknown",
                 parent_level=level_a,
                 child_level=level_b,
-                relationship_type=RelationshipType.UNRELATED.value,
+                relationship_type=_REL_UNREL,
                 evidence=["Cannot determine relationship - hierarchy level unknown"],
                 confidence=0.0,
                 direct_containment=False
@@ -298,7 +520,7 @@ class MatryoshkaAnalyzer:
                 child_architecture=arch_b['name'],
                 parent_level=level_a,
                 child_level=level_b,
-                relationship_type=RelationshipType.PEER.value,
+                relationship_type=_REL_PEER,
                 evidence=[f"Both at {level_a} level"],
                 confidence=min(metadata_a.confidence, metadata_b.confidence),
                 direct_containment=False
@@ -311,21 +533,23 @@ class MatryoshkaAnalyzer:
             child_arch = arch_b
             parent_meta = metadata_a
             child_meta = metadata_b
-            relationship_type = RelationshipType.PARENT_CHILD
+            relationship_type = _REL_PC
+            parent_subarchs = subarchs_a
         else:
             # B is at higher level (parent), A is at lower level (child)
             parent_arch = arch_b
             child_arch = arch_a
             parent_meta = metadata_b
             child_meta = metadata_a
-            relationship_type = RelationshipType.CHILD_PARENT
+            relationship_type = _REL_CP
+            parent_subarchs = subarchs_b
 
         # Check if relationship is direct or through intermediates
         level_gap = abs(idx_a - idx_b)
         direct = level_gap == 1
 
         if not direct:
-            relationship_type = RelationshipType.NESTED_INDIRECT
+            relationship_type = _REL_NESTED
 
         evidence = [
             f"{parent_arch['name']} at {parent_meta.inferred_level} level",
@@ -337,7 +561,8 @@ class MatryoshkaAnalyzer:
             evidence.append(f"Indirect nesting - {level_gap - 1} intermediate level(s) may exist")
 
         # Check for explicit containment references
-        explicit_containment = self._check_explicit_containment(parent_arch, child_arch)
+        names, ids = parent_subarchs
+        explicit_containment = child_arch['name'] in names or child_arch.get('id') in ids
         if explicit_containment:
             evidence.append("Explicit containment reference found")
             direct = True
@@ -348,31 +573,30 @@ class MatryoshkaAnalyzer:
             child_architecture=child_arch['name'],
             parent_level=parent_meta.inferred_level,
             child_level=child_meta.inferred_level,
-            relationship_type=relationship_type.value,
+            relationship_type=relationship_type,
             evidence=evidence,
             confidence=min(parent_meta.confidence, child_meta.confidence),
             direct_containment=direct
         )
 
-    def _check_explicit_containment(
-        self,
-        parent_arch: Dict[str, Any],
-        child_arch: Dict[str, Any]
-    ) -> bool:
-        """Check if parent explicitly references child as subarchitecture"""
-        # Check if parent has subarchitectures list
-        subarchs = parent_arch.get('subarchitectures', [])
-        child_name = child_arch['name']
-
-        return any(
-            sub.get('name') == child_name or sub.get('id') == child_arch.get('id')
-            for sub in subarchs
-        )
+    def _subarch_index(self, arch: Dict[str, Any]) -> Tuple[frozenset, frozenset]:
+        """
+        Names and ids referenced by an architecture's subarchitectures
+
+        analyze_all_relationships builds these once per architecture and
+        reuses them across all of its pairs.
+        """
+        subarchs = arch.get('subarchitectures')
+        if not subarchs:
+            return _EMPTY_INDEX, _EMPTY_INDEX
+        return (frozenset(sub.get('name') for sub in subarchs),
+                frozenset(sub.get('id') for sub in subarchs))
 
     def discover_hierarchical_gaps(
         self,
         architectures: List[Dict[str, Any]],
-        relationships: List[NestingRelationship]
+        relationships: List[NestingRelationship],
+        hierarchy_metadata: Optional[Dict[str, HierarchyMetadata]] = None
     ) -> List[HierarchicalGap]:
         """
         Discover missing intermediate levels in the hierarchy
@@ -381,52 +605,54 @@ class MatryoshkaAnalyzer:
         1. Two architectures at non-adjacent levels with no intermediate
         2. Multiple architectures at same level with no common parent
         3. Leaf architecture with no known parent
+
+        Pass hierarchy_metadata when it is already at hand (as returned by
+        infer_all_hierarchy_levels) to skip re-inferring every level.
         """
         gaps = []
 
         # Infer hierarchy for all architectures
-        hierarchy_metadata = {
-            arch['name']: self.infer_hierarchy_level(arch)
-            for arch in architectures
-        }
+        if hierarchy_metadata is None:
+            hierarchy_metadata = self.infer_all_hierarchy_levels(architectures)
 
-        # Case 1: Non-adjacent levels with no intermediate
+        # One pass over relationships: reverse index of child architecture ->
+        # names of its parents, plus the indirect nestings for case 1
+        parents_of: Dict[str, Set[str]] = {}
+        nested = []
         for rel in relationships:
-            if rel.relationship_type == RelationshipType.NESTED_INDIRECT.value:
-                # There's a gap between parent and child
-                gap = self._identify_missing_intermediate(
-                    rel.parent_architecture,
-                    rel.child_architecture,
-                    rel.parent_level,
-                    rel.child_level
-                )
-                if gap:
-                    gaps.append(gap)
+            parents_of.setdefault(rel.child_architecture, set()).add(rel.parent_architecture)
+            if rel.relationship_type == _REL_NESTED:
+                nested.append(rel)
+
+        # Case 1: Non-adjacent levels with no intermediate
+        for rel in nested:
+            # There's a gap between parent and child
+            gap = self._identify_missing_intermediate(
+                rel.parent_architecture,
+                rel.child_architecture,
+                rel.parent_level,
+                rel.child_level
+            )
+            if gap:
+                gaps.append(gap)
 
         # Case 2: Multiple peers with no common parent
-        peers_by_level = {}
+        peers_by_level: Dict[str, List[str]] = defaultdict(list)
         for name, meta in hierarchy_metadata.items():
-            level = meta.inferred_level
-            if level not in peers_by_level:
-                peers_by_level[level] = []
-            peers_by_level[level].append(name)
+            peers_by_level[meta.inferred_level].append(name)
 
         for level, peers in peers_by_level.items():
             if len(peers) > 1:
                 # Check if any have a common parent
                 common_parent_gap = self._check_missing_common_parent(
-                    peers, level, relationships
+                    peers, level, parents_of
                 )
                 if common_parent_gap:
                     gaps.append(common_parent_gap)
 
         # Case 3: Leaf architectures with no parent
         for arch in architectures:
-            has_parent = any(
-                rel.child_architecture == arch['name']
-                for rel in relationships
-            )
-            if not has_parent:
+            if arch['name'] not in parents_of:
                 gap = self._identify_missing_parent(
                     arch['name'],
                     hierarchy_metadata[arch['name']]
@@ -445,10 +671,9 @@ class MatryoshkaAnalyzer:
     ) -> Optional[HierarchicalGap]:
         """Identify missing intermediate level between parent and child"""
         # Get level indices
-        try:
-            idx_parent = [l.value for l in self.hierarchy_order].index(parent_level)
-            idx_child = [l.value for l in self.hierarchy_order].index(child_level)
-        except ValueError:
+        idx_parent = self._level_index.get(parent_level)
+        idx_child = self._level_index.get(child_level)
+        if idx_parent is None or idx_child is None:
             return None
 
         level_gap = abs(idx_parent - idx_child)
@@ -457,7 +682,7 @@ class MatryoshkaAnalyzer:
 
         # Identify missing level
         missing_idx = (idx_parent + idx_child) // 2
-        missing_level = self.hierarchy_order[missing_idx].value
+        missing_level = self._level_values[missing_idx]
 
         return HierarchicalGap(
             id=f"gap_intermediate_{parent_name}_{child_name}",
@@ -479,37 +704,31 @@ class MatryoshkaAnalyzer:
         self,
         peers: List[str],
         level: str,
-        relationships: List[NestingRelationship]
+        parents_of: Dict[str, Set[str]]
     ) -> Optional[HierarchicalGap]:
-        """Check if peer architectures are missing a common parent"""
-        # Check if any peers have a common parent
-        parents = {}
-        for peer in peers:
-            peer_parents = [
-                rel.parent_architecture
-                for rel in relationships
-                if rel.child_architecture == peer
-            ]
-            parents[peer] = peer_parents
+        """
+        Check if peer architectures are missing a common parent
 
+        parents_of maps each child architecture name to its parent names
+        (built once per gap discovery from the relationship list).
+        """
         # If all peers have the same parent, no gap
-        if all(parents[peer] for peer in peers):
-            common = set(parents[peers[0]])
+        if all(peer in parents_of for peer in peers):
+            common = set(parents_of[peers[0]])
             for peer in peers[1:]:
-                common &= set(parents[peer])
+                common &= parents_of[peer]
             if common:
                 return None  # Have common parent
 
         # Missing common parent
         # Determine what level the parent should be at
-        try:
-            idx_current = [l.value for l in self.hierarchy_order].index(level)
-            if idx_current < len(self.hierarchy_order) - 1:
-                missing_level = self.hierarchy_order[idx_current + 1].value
-            else:
-                return None  # Already at top level
-        except ValueError:
+        idx_current = self._level_index.get(level)
+        if idx_current is None:
             return None
+        if idx_current < len(self._level_values) - 1:
+            missing_level = self._level_values[idx_current + 1]
+        else:
+            return None  # Already at top level
 
         return HierarchicalGap(
             id=f"gap_common_parent_{'_'.join(peers[:3])}",
@@ -536,17 +755,16 @@ class MatryoshkaAnalyzer:
         level = metadata.inferred_level
 
         # Don't report missing parent for top-level architectures
-        if level == HierarchyLevel.ENTERPRISE.value:
+        if level == _LEVEL_ENTERPRISE:
             return None
 
         # Determine what level the parent should be at
-        try:
-            idx_current = [l.value for l in self.hierarchy_order].index(level)
-            if idx_current < len(self.hierarchy_order) - 1:
-                missing_level = self.hierarchy_order[idx_current + 1].value
-            else:
-                return None
-        except ValueError:
+        idx_current = self._level_index.get(level)
+        if idx_current is None:
+            return None
+        if idx_current < len(self._level_values) - 1:
+            missing_level = self._level_values[idx_current + 1]
+        else:
             return None
 
         return HierarchicalGap(
@@ -574,9 +792,9 @@ class MatryoshkaAnalyzer:
     ) -> str:
         """Generate comprehensive matryoshka analysis report"""
         report = []
-        report.append("="*70)
+        report.append(_SEP)
         report.append("MATRYOSHKA (HIERARCHICAL NESTING) ANALYSIS")
-        report.append("="*70)
+        report.append(_SEP)
         report.append("")
         report.append("Like Russian nesting dolls, system architectures are often nested")
         report.append("hierarchically rather than linked peer-to-peer.")
@@ -586,19 +804,16 @@ class MatryoshkaAnalyzer:
         report.append("• At the same level (peers)")
         report.append("• At different levels (parent-child)")
         report.append("• Nested through intermediate levels")
-        report.append("="*70)
+        report.append(_SEP)
         report.append("")
 
         # Show hierarchy levels
         report.append("DETECTED HIERARCHY LEVELS")
-        report.append("-"*70)
+        report.append(_DASH)
 
-        levels_found = {}
+        levels_found: Dict[str, List[Tuple[str, float]]] = defaultdict(list)
         for name, meta in hierarchy_metadata.items():
-            level = meta.inferred_level
-            if level not in levels_found:
-                levels_found[level] = []
-            levels_found[level].append((name, meta.confidence))
+            levels_found[meta.inferred_level].append((name, meta.confidence))
 
         for level in self.hierarchy_order:
             level_val = level.value
@@ -607,19 +822,27 @@ class MatryoshkaAnalyzer:
                 for name, confidence in levels_found[level_val]:
                     report.append(f"  • {name} (confidence: {confidence:.0%})")
 
-        if HierarchyLevel.UNKNOWN.value in levels_found:
+        if _LEVEL_UNKNOWN in levels_found:
             report.append(f"\nUNKNOWN Level:")
-            for name, confidence in levels_found[HierarchyLevel.UNKNOWN.value]:
+            for name, confidence in levels_found[_LEVEL_UNKNOWN]:
                 report.append(f"  • {name}")
 
         # Show relationships
-        report.append("\n" + "="*70)
+        report.append("\n" + _SEP)
         report.append("HIERARCHICAL RELATIONSHIPS")
-        report.append("="*70)
-
-        peer_rels = [r for r in relationships if r.relationship_type == RelationshipType.PEER.value]
-        parent_child_rels = [r for r in relationships if r.relationship_type in [RelationshipType.PARENT_CHILD.value, RelationshipType.CHILD_PARENT.value]]
-        indirect_rels = [r for r in relationships if r.relationship_type == RelationshipType.NESTED_INDIRECT.value]
+        report.append(_SEP)
+
+        # Split relationships by type in a single pass
+        peer_rels = []
+        parent_child_rels = []
+        indirect_rels = []
+        for r in relationships:
+            if r.relationship_type == _REL_PEER:
+                peer_rels.append(r)
+            elif r.relationship_type in _PARENT_CHILD_TYPES:
+                parent_child_rels.append(r)
+            elif r.relationship_type == _REL_NESTED:
+                indirect_rels.append(r)
 
         if peer_rels:
             report.append("\nPeer Relationships (same level):")
@@ -643,9 +866,9 @@ class MatryoshkaAnalyzer:
 
         # Show gaps
         if gaps:
-            report.append("\n" + "="*70)
+            report.append("\n" + _SEP)
             report.append("HIERARCHICAL GAPS (Missing Levels)")
-            report.append("="*70)
+            report.append(_SEP)
             report.append("")
             report.append("⚠️  KNOWLEDGE GAPS: The following intermediate levels may exist")
             report.append("but are not yet documented:")
@@ -661,9 +884,9 @@ class MatryoshkaAnalyzer:
                 report.append("")
 
         # Next steps
-        report.append("="*70)
+        report.append(_SEP)
         report.append("RECOMMENDED NEXT STEPS")
-        report.append("="*70)
+        report.append(_SEP)
         report.append("1. Verify hierarchy levels for each architecture")
         report.append("2. Investigate hierarchical gaps:")
         report.append("   • Document missing intermediate levels if they exist")
@@ -681,8 +904,7 @@ class MatryoshkaAnalyzer:
 def load_graph(file_path: str) -> dict:
     """Load system_of_systems_graph.json file"""
     try:
-        with open(file_path, 'r') as f:
-            return json.load(f)
+        return load_json(file_path)
     except FileNotFoundError:
         print(f"Error: File not found: {file_path}", file=sys.stderr)
         sys.exit(1)
@@ -695,6 +917,18 @@ def graph_to_architectures(graph: dict) -> List[dict]:
     """
     Convert system_of_systems_graph nodes to architecture format with format auto-detection
 
+    See graph_to_architectures_iter for the field mapping and supported formats.
+    """
+    return list(graph_to_architectures_iter(graph))
+
+
+def graph_to_architectures_iter(graph: dict) -> Iterator[dict]:
+    """
+    Yield system_of_systems_graph nodes as architectures, with format auto-detection
+
+    Lets callers process each architecture as it is built instead of
+    materializing the list first.
+
     Maps from graph node format to the format expected by MatryoshkaAnalyzer:
     - node.name → architecture.name
     - node.raw.description → architecture.description
@@ -719,14 +953,15 @@ def graph_to_architectures(graph: dict) -> List[dict]:
         # Format 3: Direct nodes
         nodes = graph['nodes']
     else:
-        # Return empty if no recognizable format
-        return []
-
-    architectures = []
+        # Nothing to yield if no recognizable format
+        return
 
     for node in nodes:
-        # Normalize node field names
+        # Normalize node field names; names are compared and hashed repeatedly
+        # during relationship and gap analysis, so intern them once here
         node_name = node.get('node_name', node.get('name', 'Unknown'))
+        if isinstance(node_name, str):
+            node_name = sys.intern(node_name)
 
         raw = node.get('raw', {})
 
@@ -792,15 +1027,13 @@ def graph_to_architectures(graph: dict) -> List[dict]:
         if 'status' in node:
             arch['status'] = node['status']
 
-        architectures.append(arch)
-
-    return architectures
+        yield arch
 
 
 def write_output(results: dict, output_path: Optional[str], format: str):
     """Write analysis results to file or stdout"""
     if format == 'json':
-        output = json.dumps(results, indent=2)
+        output = dumps_json(results)
     elif format == 'markdown':
         output = results['report']  # Already formatted as text, could enhance for markdown
     else:  # text
@@ -830,35 +1063,25 @@ def analyze_graph(graph_file: str, output_path: Optional[str] = None, format: st
     # Load graph
     graph = load_graph(graph_file)
 
-    # Convert to architecture format
-    architectures = graph_to_architectures(graph)
+    analyzer = MatryoshkaAnalyzer()
+
+    # Convert to architecture format, inferring each hierarchy level while
+    # the architecture is freshly built
+    architectures = []
+    hierarchy_metadata = {}
+    for arch in graph_to_architectures_iter(graph):
+        architectures.append(arch)
+        hierarchy_metadata[arch['name']] = analyzer.infer_hierarchy_level(arch)
 
     if not architectures:
         print("Error: No architectures found in graph", file=sys.stderr)
         sys.exit(1)
 
-    # Run analysis
-    analyzer = MatryoshkaAnalyzer()
-
-    # Infer hierarchy levels
-    hierarchy_metadata = {}
-    for arch in architectures:
-        meta = analyzer.infer_hierarchy_level(arch)
-        hierarchy_metadata[arch['name']] = meta
-
     # Analyze relationships
-    relationships = []
-    for i, arch_a in enumerate(architectures):
-        for arch_b in architectures[i+1:]:
-            rel = analyzer.analyze_relationship(
-                arch_a, arch_b,
-                hierarchy_metadata[arch_a['name']],
-                hierarchy_metadata[arch_b['name']]
-            )
-            relationships.append(rel)
+    relationships = analyzer.analyze_all_relationships(architectures, hierarchy_metadata)
 
     # Discover gaps
-    gaps = analyzer.discover_hierarchical_gaps(architectures, relationships)
+    gaps = analyzer.discover_hierarchical_gaps(architectures, relationships, hierarchy_metadata)
 
     # Generate report
     report = analyzer.generate_matryoshka_report(
@@ -892,8 +1115,8 @@ def analyze_graph(graph_file: str, output_path: Optional[str] = None, format: st
     write_output(results, output_path, format)
 
 
-def parse_args():
-    """Parse command-line arguments"""
+def parse_args(argv: Optional[List[str]] = None):
+    """Parse command-line arguments (defaults to sys.argv[1:])"""
     parser = argparse.ArgumentParser(
         description='Matryoshka (hierarchical nesting) analysis for system architectures',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -907,6 +1130,9 @@ Examples:
 
   # Run demo with hardcoded test data
   %(prog)s --demo
+
+  # Run demo, listing every inferred level and relationship
+  %(prog)s --demo --verbose
 """
     )
 
@@ -937,11 +1163,22 @@ Examples:
         help='Run demonstration with hardcoded test data'
     )
 
-    return parser.parse_args()
+    parser.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help='With --demo, also list each inferred level and pairwise relationship'
+    )
+
+    return parser.parse_args(argv)
+
 
+def demo(verbose: bool = False):
+    """
+    Demo of matryoshka analysis with hardcoded test data
 
-def demo():
-    """Demo of matryoshka analysis with hardcoded test data"""
+    Per-architecture levels and per-pair relationships are only listed when
+    verbose; the gap count and final report are always printed.
+    """
     print("Running matryoshka analysis demo...\n", file=sys.stderr)
 
     # Example: Multi-level vehicle architectures
@@ -988,28 +1225,23 @@ def demo():
     analyzer = MatryoshkaAnalyzer()
 
     # Infer hierarchy levels
-    hierarchy_metadata = {}
-    for arch in architectures:
-        meta = analyzer.infer_hierarchy_level(arch)
-        hierarchy_metadata[arch['name']] = meta
-        print(f"{arch['name']}: {meta.inferred_level} (confidence: {meta.confidence:.0%})")
-    print()
+    hierarchy_metadata = analyzer.infer_all_hierarchy_levels(architectures)
+    if verbose:
+        sys.stdout.write("".join(
+            f"{name}: {meta.inferred_level} (confidence: {meta.confidence:.0%})\n"
+            for name, meta in hierarchy_metadata.items()
+        ) + "\n")
 
     # Analyze relationships
-    relationships = []
-    for i, arch_a in enumerate(architectures):
-        for arch_b in architectures[i+1:]:
-            rel = analyzer.analyze_relationship(
-                arch_a, arch_b,
-                hierarchy_metadata[arch_a['name']],
-                hierarchy_metadata[arch_b['name']]
-            )
-            relationships.append(rel)
-            print(f"{rel.parent_architecture} <-> {rel.child_architecture}: {rel.relationship_type}")
-    print()
+    relationships = analyzer.analyze_all_relationships(architectures, hierarchy_metadata)
+    if verbose:
+        sys.stdout.write("".join(
+            f"{rel.parent_architecture} <-> {rel.child_architecture}: {rel.relationship_type}\n"
+            for rel in relationships
+        ) + "\n")
 
     # Discover gaps
-    gaps = analyzer.discover_hierarchical_gaps(architectures, relationships)
+    gaps = analyzer.discover_hierarchical_gaps(architectures, relationships, hierarchy_metadata)
     print(f"Discovered {len(gaps)} hierarchical gap(s)\n")
 
     # Generate report
@@ -1022,13 +1254,13 @@ def demo():
     print(report)
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """Main entry point - handles CLI arguments or runs demo"""
-    args = parse_args()
+    args = parse_args(argv)
 
     if args.demo:
         # Run demo with hardcoded test data
-        demo()
+        demo(verbose=args.verbose)
     elif args.graph_file:
         # Analyze provided graph file
         analyze_graph(args.graph_file, args.output, args.format)
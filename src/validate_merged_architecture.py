@@ -16,14 +16,30 @@ Usage:
     python3 validate_merged_architecture.py <merged_graph.json> [--format json|text]
 """
 
-import json
+import hashlib
+import os
 import sys
 import argparse
+from array import array
 from pathlib import Path
-from typing import Dict, Any, List, Set, Tuple
+from typing import Dict, Any, List, Optional
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
+from json_io import dumps_json, load_json
+
+# Opt-in (--cache) on-disk cache of validation results, keyed on the
+# contents of the graph file and of this script
+CACHE_DIR = Path.home() / '.cache' / 'chain_reflow' / 'validate'
+# Least recently used cache files beyond this many are deleted
+CACHE_MAX_ENTRIES = 64
+
+
+# Node types allowed to have no incoming edges (entry points)
+_SINK_OK_TYPES = frozenset({'external', 'user'})
+# Node types allowed to have no outgoing edges (leaves)
+_SOURCE_OK_TYPES = frozenset({'infrastructure', 'data_store'})
+
 
 @dataclass
 class ValidationIssue:
@@ -38,24 +54,94 @@ class ValidationIssue:
         return asdict(self)
 
 
+def _strongly_connected_components(adj: List[List[int]]) -> List[List[int]]:
+    """
+    Strongly connected components of a graph given as adjacency lists
+
+    Iterative Tarjan: an explicit stack of (node, neighbor iterator) frames
+    replaces recursion. Components are returned sorted by their lowest node
+    index, each with its nodes in ascending order.
+    """
+    n = len(adj)
+    index = array('i', [-1]) * n
+    lowlink = array('i', [0]) * n
+    on_stack = bytearray(n)
+    stack: List[int] = []
+    components: List[List[int]] = []
+    counter = 0
+
+    for root in range(n):
+        if index[root] != -1:
+            continue
+
+        index[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        work = [(root, iter(adj[root]))]
+
+        while work:
+            node, neighbors = work[-1]
+            for neighbor in neighbors:
+                if index[neighbor] == -1:
+                    # Descend into unvisited neighbor; resume this frame later
+                    index[neighbor] = lowlink[neighbor] = counter
+                    counter += 1
+                    stack.append(neighbor)
+                    on_stack[neighbor] = 1
+                    work.append((neighbor, iter(adj[neighbor])))
+                    break
+                if on_stack[neighbor] and index[neighbor] < lowlink[node]:
+                    lowlink[node] = index[neighbor]
+            else:
+                # All neighbors done: propagate lowlink and pop any finished SCC
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if lowlink[node] < lowlink[parent]:
+                        lowlink[parent] = lowlink[node]
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        component.append(member)
+                        if member == node:
+                            break
+                    component.sort()
+                    components.append(component)
+
+    components.sort(key=lambda component: component[0])
+    return components
+
+
 class ArchitectureValidator:
     """
     Validates merged architectures using NetworkX-style analysis
     """
 
-    def __init__(self, graph_path: Path, verbose: bool = False):
+    def __init__(self, graph_path: Path, verbose: bool = False, use_cache: bool = False,
+                 max_critical: Optional[int] = None):
         self.graph_path = graph_path
         self.verbose = verbose
+        self.use_cache = use_cache
+        if max_critical is not None and max_critical < 1:
+            raise ValueError(f"max_critical must be at least 1, got {max_critical}")
+        self.max_critical = max_critical
         self.issues: List[ValidationIssue] = []
+        self._critical_count = 0
+        self.stopped_early = False
         self.graph_data = None
         self.nodes = {}
         self.edges = []
+        self.node_ids: List[str] = []
+        self.node_index: Dict[str, int] = {}
+        self.node_types: List[str] = []
 
     def load_graph(self) -> bool:
         """Load and parse graph file with format auto-detection"""
         try:
-            with open(self.graph_path, 'r') as f:
-                data = json.load(f)
+            data = load_json(self.graph_path)
 
             # Format detection (similar to matrix_gap_detection.py)
             if 'system_of_systems_graph' in data:
@@ -75,6 +161,14 @@ class ArchitectureValidator:
             else:
                 raise ValueError("No nodes found in graph")
 
+            # Integer node index shared by all checks
+            self.node_ids = list(self.nodes.keys())
+            self.node_index = {nid: i for i, nid in enumerate(self.node_ids)}
+            self.node_types = [
+                sys.intern(str(node.get('node_type', node.get('type', 'unknown'))))
+                for node in self.nodes.values()
+            ]
+
             # Load edges
             edges_key = 'edges' if 'edges' in self.graph_data else 'links'
             if edges_key in self.graph_data:
@@ -89,6 +183,12 @@ class ArchitectureValidator:
             print(f"✗ Error loading graph: {e}", file=sys.stderr)
             return False
 
+    def _report(self, issue: ValidationIssue):
+        """Record an issue, keeping a running count of critical ones"""
+        self.issues.append(issue)
+        if issue.severity == "critical":
+            self._critical_count += 1
+
     def check_orphaned_nodes(self) -> int:
         """
         Detect orphaned nodes (nodes with no incoming or outgoing edges)
@@ -98,45 +198,48 @@ class ArchitectureValidator:
         if self.verbose:
             print("\n[1/5] Checking for orphaned nodes...")
 
-        # Count connections for each node
-        connections = {nid: {'incoming': 0, 'outgoing': 0} for nid in self.nodes.keys()}
+        # Count connections per node in flat arrays indexed by node position
+        node_index = self.node_index
+        incoming = [0] * len(self.node_ids)
+        outgoing = [0] * len(self.node_ids)
 
         for edge in self.edges:
-            source = edge.get('source')
-            target = edge.get('target')
-            if source in connections:
-                connections[source]['outgoing'] += 1
-            if target in connections:
-                connections[target]['incoming'] += 1
+            source = node_index.get(edge.get('source'))
+            target = node_index.get(edge.get('target'))
+            if source is not None:
+                outgoing[source] += 1
+            if target is not None:
+                incoming[target] += 1
 
         # Find orphans (completely disconnected)
         orphans = []
-        for nid, conn in connections.items():
-            node = self.nodes[nid]
-            node_type = node.get('node_type', node.get('type', 'unknown'))
+        node_types = self.node_types
+        for i, nid in enumerate(self.node_ids):
+            node_type = node_types[i]
+            n_in, n_out = incoming[i], outgoing[i]
 
-            if conn['incoming'] == 0 and conn['outgoing'] == 0:
+            if n_in == 0 and n_out == 0:
                 # Completely orphaned
                 orphans.append(nid)
-                self.issues.append(ValidationIssue(
+                self._report(ValidationIssue(
                     severity="critical",
                     category="orphan",
                     node_id=nid,
                     description=f"Node '{nid}' has no connections (orphaned)",
                     recommendation="Connect node to system or remove if unused"
                 ))
-            elif conn['incoming'] == 0 and node_type not in ['external', 'user']:
+            elif n_in == 0 and node_type not in _SINK_OK_TYPES:
                 # Sink node (no incoming)
-                self.issues.append(ValidationIssue(
+                self._report(ValidationIssue(
                     severity="warning",
                     category="orphan",
                     node_id=nid,
                     description=f"Node '{nid}' has no incoming edges (sink node)",
                     recommendation="Verify this is intentional (e.g., entry point)"
                 ))
-            elif conn['outgoing'] == 0 and node_type not in ['infrastructure', 'data_store']:
+            elif n_out == 0 and node_type not in _SOURCE_OK_TYPES:
                 # Source node (no outgoing)
-                self.issues.append(ValidationIssue(
+                self._report(ValidationIssue(
                     severity="warning",
                     category="orphan",
                     node_id=nid,
@@ -154,53 +257,45 @@ class ArchitectureValidator:
 
     def check_circular_dependencies(self) -> int:
         """
-        Detect circular dependencies using DFS cycle detection
+        Detect circular dependencies as strongly connected components
+
+        Uses iterative Tarjan SCC over invocation/dependency/data_flow edges,
+        so deep dependency chains cannot hit the recursion limit. Each SCC
+        with more than one node, or a single node with a self-loop, is one
+        circular dependency.
 
         Returns: Number of cycles found
         """
         if self.verbose:
             print("\n[2/5] Checking for circular dependencies...")
 
-        # Build adjacency list (only for invocation/dependency edges)
-        adj = {nid: [] for nid in self.nodes.keys()}
+        # Build adjacency list over integer node indices (only for
+        # invocation/dependency edges between known nodes)
+        node_ids = self.node_ids
+        id_to_idx = self.node_index
+        adj: List[List[int]] = [[] for _ in node_ids]
         for edge in self.edges:
             edge_type = edge.get('edge_type', edge.get('type', 'unknown'))
             if edge_type in ['invocation', 'dependency', 'data_flow']:
-                source = edge.get('source')
-                target = edge.get('target')
-                if source and target:
+                source = id_to_idx.get(edge.get('source'))
+                target = id_to_idx.get(edge.get('target'))
+                if source is not None and target is not None:
                     adj[source].append(target)
 
-        # DFS cycle detection
-        def has_cycle_from(node: str, visited: Set[str], rec_stack: Set[str]) -> bool:
-            visited.add(node)
-            rec_stack.add(node)
-
-            for neighbor in adj.get(node, []):
-                if neighbor not in visited:
-                    if has_cycle_from(neighbor, visited, rec_stack):
-                        return True
-                elif neighbor in rec_stack:
-                    # Cycle detected
-                    return True
-
-            rec_stack.remove(node)
-            return False
-
-        visited = set()
         cycles_found = 0
 
-        for node in self.nodes.keys():
-            if node not in visited:
-                if has_cycle_from(node, visited, set()):
-                    cycles_found += 1
-                    self.issues.append(ValidationIssue(
-                        severity="critical",
-                        category="cycle",
-                        node_id=node,
-                        description=f"Circular dependency detected involving '{node}'",
-                        recommendation="Break cycle by introducing abstraction or removing dependency"
-                    ))
+        for component in _strongly_connected_components(adj):
+            first = component[0]
+            if len(component) > 1 or first in adj[first]:
+                cycles_found += 1
+                node = node_ids[first]
+                self._report(ValidationIssue(
+                    severity="critical",
+                    category="cycle",
+                    node_id=node,
+                    description=f"Circular dependency detected involving '{node}'",
+                    recommendation="Break cycle by introducing abstraction or removing dependency"
+                ))
 
         if self.verbose:
             if cycles_found > 0:
@@ -219,30 +314,27 @@ class ArchitectureValidator:
         if self.verbose:
             print("\n[3/5] Checking interface coverage...")
 
+        # Collect provided interfaces first so requirements can be checked
+        # inline in a single pass, without building and diffing a second set
         provided_interfaces = set()
-        required_interfaces = set()
+        for node in self.nodes.values():
+            provided_interfaces.update(node.get('interfaces_provided', ()))
 
-        # Collect provided and required interfaces
-        for node_id, node in self.nodes.items():
-            # Provided interfaces
-            provided = node.get('interfaces_provided', [])
-            provided_interfaces.update(provided)
-
-            # Required interfaces
-            required = node.get('interfaces_required', [])
-            for iface in required:
+        required_interfaces = set() if self.verbose else None
+        unmet_critical = set()
+        for node in self.nodes.values():
+            for iface in node.get('interfaces_required', ()):
                 # Strip "(future)" markers
                 clean_iface = iface.replace(' (future)', '').strip()
-                required_interfaces.add(clean_iface)
-
-        # Find unmet requirements
-        unmet = required_interfaces - provided_interfaces
-
-        # Filter out intentional future interfaces
-        unmet_critical = {i for i in unmet if '(future)' not in i}
+                if required_interfaces is not None:
+                    required_interfaces.add(clean_iface)
+                # Skip intentional future interfaces and met requirements
+                if '(future)' in clean_iface or clean_iface in provided_interfaces:
+                    continue
+                unmet_critical.add(clean_iface)
 
         for iface in unmet_critical:
-            self.issues.append(ValidationIssue(
+            self._report(ValidationIssue(
                 severity="critical",
                 category="interface",
                 description=f"Interface '{iface}' is required but has no provider",
@@ -268,31 +360,39 @@ class ArchitectureValidator:
         if self.verbose:
             print("\n[4/5] Checking for disconnected components...")
 
-        # Build undirected adjacency for connectivity check
-        adj = {nid: set() for nid in self.nodes.keys()}
+        # Union-find over edges (undirected): no adjacency lists, no recursion
+        node_ids = self.node_ids
+        id_to_idx = self.node_index
+        parent = list(range(len(node_ids)))
+        rank = [0] * len(node_ids)
+
+        def find(i: int) -> int:
+            root = i
+            while parent[root] != root:
+                root = parent[root]
+            while parent[i] != root:  # Path compression
+                parent[i], i = root, parent[i]
+            return root
+
         for edge in self.edges:
-            source = edge.get('source')
-            target = edge.get('target')
-            if source and target:
-                adj[source].add(target)
-                adj[target].add(source)  # Undirected
-
-        # Find connected components using DFS
-        visited = set()
-        components = []
-
-        def dfs(node: str, component: List[str]):
-            visited.add(node)
-            component.append(node)
-            for neighbor in adj.get(node, []):
-                if neighbor not in visited:
-                    dfs(neighbor, component)
-
-        for node in self.nodes.keys():
-            if node not in visited:
-                component = []
-                dfs(node, component)
-                components.append(component)
+            source = id_to_idx.get(edge.get('source'))
+            target = id_to_idx.get(edge.get('target'))
+            if source is None or target is None:
+                continue
+            root_s, root_t = find(source), find(target)
+            if root_s == root_t:
+                continue
+            if rank[root_s] < rank[root_t]:
+                root_s, root_t = root_t, root_s
+            parent[root_t] = root_s  # Union by rank
+            if rank[root_s] == rank[root_t]:
+                rank[root_s] += 1
+
+        # Group nodes by root; components come out in order of their first node
+        members: Dict[int, List[str]] = {}
+        for i, nid in enumerate(node_ids):
+            members.setdefault(find(i), []).append(nid)
+        components = list(members.values())
 
         num_components = len(components)
 
@@ -300,7 +400,7 @@ class ArchitectureValidator:
             # Multiple disconnected subgraphs
             for i, comp in enumerate(components):
                 if len(comp) > 1:
-                    self.issues.append(ValidationIssue(
+                    self._report(ValidationIssue(
                         severity="warning",
                         category="connectivity",
                         description=f"Disconnected subgraph #{i+1} with {len(comp)} nodes: {', '.join(comp[:3])}{'...' if len(comp) > 3 else ''}",
@@ -342,7 +442,7 @@ class ArchitectureValidator:
 
             if missing_fields:
                 missing_count += 1
-                self.issues.append(ValidationIssue(
+                self._report(ValidationIssue(
                     severity="info",
                     category="metadata",
                     node_id=node_id,
@@ -358,41 +458,119 @@ class ArchitectureValidator:
 
         return missing_count
 
+    def _cache_path(self) -> Path:
+        """
+        Cache file for the graph
+
+        Keyed on a digest of the graph file's bytes and of this script, so
+        an edited graph or a changed check never gets stale results.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(Path(__file__).read_bytes())
+        digest.update(Path(self.graph_path).read_bytes())
+        return CACHE_DIR / f"{digest.hexdigest()}.json"
+
+    @staticmethod
+    def _prune_cache():
+        """Delete the least recently used cache files beyond CACHE_MAX_ENTRIES"""
+        entries = []
+        for path in CACHE_DIR.glob('*.json'):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except OSError:
+                pass
+        entries.sort(reverse=True)
+        for _, path in entries[CACHE_MAX_ENTRIES:]:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
     def validate(self) -> Dict[str, Any]:
         """
         Run all validation checks
 
+        With use_cache, results for a graph file with the same contents are
+        read back from CACHE_DIR instead of being recomputed (only
+        "timestamp" and "graph_file" are refreshed). Verbose runs always
+        recompute so the per-check output is shown.
+        With max_critical, remaining checks are skipped once that many
+        critical issues have been found; skipped checks are left out of
+        validation_results and "stopped_early" is set.
+
         Returns: Validation results dictionary
         """
+        cache_path = None
+        if self.use_cache and self.max_critical is None:
+            try:
+                cache_path = self._cache_path()
+            except OSError:
+                pass  # Unreadable graph: load_graph reports it below
+        if cache_path is not None and not self.verbose:
+            try:
+                results = load_json(cache_path)
+                os.utime(cache_path)  # Mark as recently used for pruning
+                results["timestamp"] = datetime.utcnow().isoformat()
+                results["graph_file"] = str(self.graph_path)
+                return results
+            except (OSError, ValueError):
+                pass
+
         if not self.load_graph():
             return {"status": "error", "message": "Failed to load graph"}
 
+        checks = [
+            ("orphaned_nodes", "check_orphaned_nodes"),
+            ("circular_dependencies", "check_circular_dependencies"),
+            ("unmet_interfaces", "check_interface_coverage"),
+            ("disconnected_subgraphs", "check_disconnected_components"),
+            ("incomplete_metadata", "check_metadata_completeness"),
+        ]
+        validation_results = {}
+        self.stopped_early = False
+        for name, method_name in checks:
+            if self.max_critical is not None and self._critical_count >= self.max_critical:
+                self.stopped_early = True
+                if self.verbose:
+                    print(f"\n✗ Stopping early: {self._critical_count} critical issues "
+                          f"(--max-critical {self.max_critical})")
+                break
+            validation_results[name] = getattr(self, method_name)()
+
         results = {
             "timestamp": datetime.utcnow().isoformat(),
             "graph_file": str(self.graph_path),
             "graph_name": self.graph_data.get('metadata', {}).get('system_name', 'Unknown'),
             "total_nodes": len(self.nodes),
             "total_edges": len(self.edges),
-            "validation_results": {
-                "orphaned_nodes": self.check_orphaned_nodes(),
-                "circular_dependencies": self.check_circular_dependencies(),
-                "unmet_interfaces": self.check_interface_coverage(),
-                "disconnected_subgraphs": self.check_disconnected_components(),
-                "incomplete_metadata": self.check_metadata_completeness()
-            },
+            "validation_results": validation_results,
             "issues": [issue.to_dict() for issue in self.issues],
             "summary": self.generate_summary()
         }
+        if self.stopped_early:
+            results["stopped_early"] = True
+
+        if cache_path is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+                with open(tmp_path, 'w') as f:
+                    f.write(dumps_json(results, indent=False))
+                os.replace(tmp_path, cache_path)
+                self._prune_cache()
+            except OSError:
+                pass  # Caching is best-effort
 
         return results
 
     def generate_summary(self) -> Dict[str, Any]:
         """Generate validation summary"""
-        critical = sum(1 for i in self.issues if i.severity == "critical")
+        critical = self._critical_count
         warnings = sum(1 for i in self.issues if i.severity == "warning")
         info = sum(1 for i in self.issues if i.severity == "info")
 
-        if critical > 0:
+        # A run cut short by max_critical never passes: checks were skipped
+        if critical > 0 or self.stopped_early:
             status = "FAIL"
         elif warnings > 0:
             status = "PASS_WITH_WARNINGS"
@@ -426,11 +604,13 @@ def format_text_report(results: Dict[str, Any]) -> str:
     lines.append("VALIDATION RESULTS")
     lines.append("-" * 80)
     vr = results['validation_results']
-    lines.append(f"Orphaned nodes:          {vr['orphaned_nodes']}")
-    lines.append(f"Circular dependencies:   {vr['circular_dependencies']}")
-    lines.append(f"Unmet interfaces:        {vr['unmet_interfaces']}")
-    lines.append(f"Disconnected subgraphs:  {vr['disconnected_subgraphs']}")
-    lines.append(f"Incomplete metadata:     {vr['incomplete_metadata']}")
+    lines.append(f"Orphaned nodes:          {vr.get('orphaned_nodes', 'skipped')}")
+    lines.append(f"Circular dependencies:   {vr.get('circular_dependencies', 'skipped')}")
+    lines.append(f"Unmet interfaces:        {vr.get('unmet_interfaces', 'skipped')}")
+    lines.append(f"Disconnected subgraphs:  {vr.get('disconnected_subgraphs', 'skipped')}")
+    lines.append(f"Incomplete metadata:     {vr.get('incomplete_metadata', 'skipped')}")
+    if results.get('stopped_early'):
+        lines.append("(stopped early: critical issue limit reached)")
     lines.append(f"")
 
     # Summary
@@ -472,6 +652,17 @@ def format_text_report(results: Dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Validate merged architecture for orphans, cycles, interface coverage"
@@ -497,16 +688,30 @@ def main():
         action="store_true",
         help="Verbose output"
     )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=f"Reuse results for an identical graph file, cached in {CACHE_DIR}"
+    )
+
+    parser.add_argument(
+        "--max-critical",
+        type=_positive_int,
+        metavar="N",
+        help="Skip remaining checks once N critical issues have been found"
+    )
 
     args = parser.parse_args()
 
     # Validate
-    validator = ArchitectureValidator(args.graph_file, verbose=args.verbose)
+    validator = ArchitectureValidator(args.graph_file, verbose=args.verbose,
+                                      use_cache=args.cache,
+                                      max_critical=args.max_critical)
     results = validator.validate()
 
     # Format output
     if args.format == "json":
-        output = json.dumps(results, indent=2)
+        output = dumps_json(results)
     else:
         output = format_text_report(results)
 
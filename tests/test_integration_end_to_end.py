@@ -18,10 +18,15 @@ Run with:
     pytest tests/test_integration_end_to_end.py::test_matryoshka_analysis -v
 """
 
+import contextlib
+import importlib.util
+import io
 import json
 import os
 import subprocess
+import sys
 import tempfile
+import traceback
 from pathlib import Path
 from typing import Dict, Any
 
@@ -40,28 +45,65 @@ MATRYOSHKA_TOOL = SRC_DIR / "matryoshka_analysis.py"
 CAUSALITY_TOOL = SRC_DIR / "causality_analysis.py"
 CREATIVE_LINKING_TOOL = SRC_DIR / "creative_linking.py"
 
+# The tools import their shared helpers (json_io) from src/
+sys.path.insert(0, str(SRC_DIR))
 
-def run_tool(tool_path: Path, args: list, timeout: int = 30) -> subprocess.CompletedProcess:
+
+# Tool modules imported so far, keyed by path (each is imported once per session)
+_TOOL_MODULES: Dict[Path, Any] = {}
+
+
+def _load_tool(tool_path: Path):
+    """Import an analysis tool script as a module, once per test session"""
+    module = _TOOL_MODULES.get(tool_path)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(tool_path.stem, tool_path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+        _TOOL_MODULES[tool_path] = module
+    return module
+
+
+def run_tool(tool_path: Path, args: list) -> subprocess.CompletedProcess:
     """
     Run an analysis tool and return the result.
 
+    The tool's main(argv) is called in-process with stdout/stderr captured,
+    avoiding an interpreter start-up and module import per call. Exit codes
+    from sys.exit() and uncaught exceptions map to returncode as they would
+    for `python3 tool.py ...`.
+
     Args:
         tool_path: Path to the Python tool
         args: Command-line arguments
-        timeout: Timeout in seconds
 
     Returns:
         CompletedProcess with stdout, stderr, returncode
     """
-    cmd = ["python3", str(tool_path)] + args
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        timeout=timeout,
-        cwd=str(REPO_ROOT)
+    module = _load_tool(tool_path)
+    stdout, stderr = io.StringIO(), io.StringIO()
+    returncode = 0
+    cwd = os.getcwd()
+    os.chdir(REPO_ROOT)
+    try:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                module.main(args)
+            except SystemExit as e:
+                if e.code is None or isinstance(e.code, int):
+                    returncode = e.code or 0
+                else:
+                    print(e.code, file=sys.stderr)
+                    returncode = 1
+            except Exception:
+                traceback.print_exc()
+                returncode = 1
+    finally:
+        os.chdir(cwd)
+    return subprocess.CompletedProcess(
+        ["python3", str(tool_path)] + args, returncode, stdout.getvalue(), stderr.getvalue()
     )
-    return result
 
 
 def validate_json_output(json_str: str) -> Dict[Any, Any]:
@@ -87,20 +129,41 @@ def validate_json_output(json_str: str) -> Dict[Any, Any]:
 # Test Fixtures
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_graph_path() -> Path:
     """Path to test system_of_systems_graph.json"""
     assert TEST_GRAPH.exists(), f"Test graph not found: {TEST_GRAPH}"
     return TEST_GRAPH
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_graph_data(test_graph_path) -> Dict[Any, Any]:
-    """Load test graph as dict"""
+    """Load test graph as dict (parsed once per session; do not mutate)"""
     with open(test_graph_path, 'r') as f:
         return json.load(f)
 
 
+@pytest.fixture(scope="session")
+def all_workflows() -> Dict[str, Any]:
+    """
+    Parse every workflows/*.json once per session.
+
+    Maps file name to the parsed JSON, or to the JSONDecodeError raised
+    while parsing it, so tests can report invalid files by name.
+    """
+    workflow_dir = REPO_ROOT / "workflows"
+    assert workflow_dir.exists(), f"Workflows directory not found: {workflow_dir}"
+
+    workflows = {}
+    for workflow_file in sorted(workflow_dir.glob("*.json")):
+        with open(workflow_file, 'r') as f:
+            try:
+                workflows[workflow_file.name] = json.load(f)
+            except json.JSONDecodeError as e:
+                workflows[workflow_file.name] = e
+    return workflows
+
+
 @pytest.fixture
 def temp_output_file():
     """Create temporary output file for tests"""
@@ -299,30 +362,21 @@ class TestCreativeLinking:
 class TestWorkflowValidation:
     """Tests for workflow JSON files"""
 
-    def test_all_workflows_are_valid_json(self):
+    def test_all_workflows_are_valid_json(self, all_workflows):
         """Test that all workflow JSON files are valid"""
-        workflow_dir = REPO_ROOT / "workflows"
-        assert workflow_dir.exists(), f"Workflows directory not found: {workflow_dir}"
-
-        workflow_files = list(workflow_dir.glob("*.json"))
-        assert len(workflow_files) > 0, "No workflow files found"
-
-        for workflow_file in workflow_files:
-            with open(workflow_file, 'r') as f:
-                try:
-                    data = json.load(f)
-                    assert isinstance(data, dict), f"{workflow_file.name}: Must be JSON object"
-                    assert "workflow_metadata" in data, f"{workflow_file.name}: Missing workflow_metadata"
-                except json.JSONDecodeError as e:
-                    pytest.fail(f"{workflow_file.name}: Invalid JSON - {e}")
-
-    def test_meta_analysis_workflow_structure(self):
-        """Test that meta-analysis workflow has required structure"""
-        workflow_file = REPO_ROOT / "workflows" / "99-chain_meta_analysis.json"
-        assert workflow_file.exists(), "Meta-analysis workflow not found"
+        assert len(all_workflows) > 0, "No workflow files found"
 
-        with open(workflow_file, 'r') as f:
-            workflow = json.load(f)
+        for name, data in all_workflows.items():
+            if isinstance(data, json.JSONDecodeError):
+                pytest.fail(f"{name}: Invalid JSON - {data}")
+            assert isinstance(data, dict), f"{name}: Must be JSON object"
+            assert "workflow_metadata" in data, f"{name}: Missing workflow_metadata"
+
+    def test_meta_analysis_workflow_structure(self, all_workflows):
+        """Test that meta-analysis workflow has required structure"""
+        assert "99-chain_meta_analysis.json" in all_workflows, "Meta-analysis workflow not found"
+        workflow = all_workflows["99-chain_meta_analysis.json"]
+        assert isinstance(workflow, dict), "Meta-analysis workflow is not a valid JSON object"
 
         # Check required fields
         assert "workflow_metadata" in workflow
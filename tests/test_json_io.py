@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared JSON helpers (src/json_io.py).
+
+Every test runs twice: with orjson (skipped when it is not installed) and
+with the stdlib json fallback, so both backends read and write the same
+values.
+
+Run with:
+    pytest tests/test_json_io.py -v
+"""
+
+import json
+import math
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+
+sys.path.insert(0, str(SRC_DIR))
+
+import json_io  # noqa: E402
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run a test against each JSON backend"""
+    if request.param == "orjson":
+        if json_io.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(json_io, "orjson", None)
+    return request.param
+
+
+SAMPLE = {
+    "name": "Grünwald → system",
+    "levels": ["system", "subsystem"],
+    "confidence": 0.85,
+    "small": 1e-05,
+    "large": 1e16,
+    "count": 3,
+    "node_id": None,
+    "nested": {"ok": True, "items": [1, 2.5, "x"]},
+}
+
+
+def test_dumps_is_ascii_and_round_trips(backend):
+    for indent in (True, False):
+        text = json_io.dumps_json(SAMPLE, indent=indent)
+        assert text.isascii()
+        assert json.loads(text) == SAMPLE
+
+
+def test_dumps_indentation(backend):
+    assert json_io.dumps_json({"a": [1]}) == '{\n  "a": [\n    1\n  ]\n}'
+    assert json_io.dumps_json({"a": [1]}, indent=False) == '{"a":[1]}'
+
+
+def test_dumps_keeps_non_finite_floats(backend):
+    data = {"nan": float("nan"), "inf": float("inf"), "ninf": -math.inf, "none": None}
+    parsed = json.loads(json_io.dumps_json(data))
+    assert math.isnan(parsed["nan"])
+    assert parsed["inf"] == math.inf
+    assert parsed["ninf"] == -math.inf
+    assert parsed["none"] is None
+
+
+def test_dumps_non_string_keys(backend):
+    assert json.loads(json_io.dumps_json({1: "a"})) == {"1": "a"}
+
+
+def test_dump_and_load_file(backend, tmp_path):
+    path = tmp_path / "data.json"
+    json_io.dump_json(path, SAMPLE)
+    assert path.read_bytes().isascii()
+    assert json_io.load_json(path) == SAMPLE
+
+
+def test_load_accepts_non_finite_literals(backend, tmp_path):
+    path = tmp_path / "graph.json"
+    path.write_text('{"weight": NaN, "limit": Infinity}')
+    data = json_io.load_json(path)
+    assert math.isnan(data["weight"])
+    assert data["limit"] == math.inf
+
+
+def test_load_utf8_file(backend, tmp_path):
+    path = tmp_path / "graph.json"
+    path.write_text('{"name": "Grünwald"}', encoding="utf-8")
+    assert json_io.load_json(path) == {"name": "Grünwald"}
+
+
+def test_load_invalid_json(backend, tmp_path):
+    path = tmp_path / "bad.json"
+    path.write_text('{"nodes": [')
+    with pytest.raises(json.JSONDecodeError):
+        json_io.load_json(path)
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Tests for the merged architecture validator (src/validate_merged_architecture.py).
+
+Covers cycle detection (strongly connected components, self-loops, deep
+chains), edges that reference unknown nodes, --max-critical, and the
+opt-in results cache.
+
+Run with:
+    pytest tests/test_validate_merged_architecture.py -v
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+
+REPO_ROOT = Path(__file__).parent.parent
+SRC_DIR = REPO_ROOT / "src"
+VALIDATE_TOOL = SRC_DIR / "validate_merged_architecture.py"
+
+sys.path.insert(0, str(SRC_DIR))
+
+import validate_merged_architecture  # noqa: E402
+from validate_merged_architecture import ArchitectureValidator  # noqa: E402
+
+
+def write_graph(path: Path, node_ids: List[str], edges: List[Tuple[str, str]]) -> Path:
+    """Write a minimal graph with complete node metadata and dependency edges"""
+    graph = {
+        "nodes": [
+            {"node_id": nid, "node_name": nid, "node_type": "service", "status": "active"}
+            for nid in node_ids
+        ],
+        "edges": [{"source": s, "target": t, "edge_type": "dependency"} for s, t in edges],
+    }
+    path.write_text(json.dumps(graph))
+    return path
+
+
+def validate(path: Path, **kwargs):
+    """Validate a graph file; return the validator and its results"""
+    validator = ArchitectureValidator(path, **kwargs)
+    return validator, validator.validate()
+
+
+def issues_of(results, category: str):
+    return [issue for issue in results["issues"] if issue["category"] == category]
+
+
+# ============================================================================
+# Circular Dependencies
+# ============================================================================
+
+class TestCircularDependencies:
+    """Cycle detection counts strongly connected components"""
+
+    def test_acyclic_graph(self, tmp_path):
+        graph = write_graph(tmp_path / "g.json", ["a", "b", "c"], [("a", "b"), ("b", "c")])
+        _, results = validate(graph)
+        assert results["validation_results"]["circular_dependencies"] == 0
+
+    def test_one_cycle_counted_once(self, tmp_path):
+        graph = write_graph(tmp_path / "g.json", ["a", "b", "c"],
+                            [("a", "b"), ("b", "c"), ("c", "a")])
+        _, results = validate(graph)
+        assert results["validation_results"]["circular_dependencies"] == 1
+        assert len(issues_of(results, "cycle")) == 1
+
+    def test_separate_cycles_counted_separately(self, tmp_path):
+        graph = write_graph(tmp_path / "g.json", ["a", "b", "c", "d", "e"],
+                            [("a", "b"), ("b", "a"), ("b", "c"),
+                             ("c", "d"), ("d", "e"), ("e", "c")])
+        _, results = validate(graph)
+        assert results["validation_results"]["circular_dependencies"] == 2
+        assert sorted(i["node_id"] for i in issues_of(results, "cycle")) == ["a", "c"]
+
+    def test_self_loop_is_a_cycle(self, tmp_path):
+        graph = write_graph(tmp_path / "g.json", ["a", "b"], [("a", "a"), ("a", "b")])
+        _, results = validate(graph)
+        assert results["validation_results"]["circular_dependencies"] == 1
+        assert issues_of(results, "cycle")[0]["node_id"] == "a"
+
+    def test_deep_chain_does_not_recurse(self, tmp_path):
+        # Far deeper than the default recursion limit
+        node_ids = [f"n{i}" for i in range(5000)]
+        edges = list(zip(node_ids, node_ids[1:]))
+        graph = write_graph(tmp_path / "chain.json", node_ids, edges)
+        _, results = validate(graph)
+        assert results["validation_results"]["circular_dependencies"] == 0
+
+        # Closing the chain makes it one big cycle
+        graph = write_graph(tmp_path / "ring.json", node_ids, edges + [(node_ids[-1], node_ids[0])])
+        _, results = validate(graph)
+        assert results["validation_results"]["circular_dependencies"] == 1
+
+
+# ============================================================================
+# Unknown Nodes
+# ============================================================================
+
+class TestUnknownNodes:
+    """Edges to or from nodes that are not in the graph are ignored"""
+
+    def test_edges_to_unknown_nodes_skipped(self, tmp_path):
+        graph = write_graph(tmp_path / "g.json", ["a", "b"],
+                            [("a", "b"), ("b", "ghost"), ("ghost", "a"), ("ghost", "ghost")])
+        _, results = validate(graph)
+        vr = results["validation_results"]
+        assert vr["circular_dependencies"] == 0
+        assert vr["orphaned_nodes"] == 0
+        assert vr["disconnected_subgraphs"] == 0
+        assert all(issue["node_id"] != "ghost" for issue in results["issues"])
+
+
+# ============================================================================
+# --max-critical
+# ============================================================================
+
+def run_validator(args: list) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, str(VALIDATE_TOOL)] + [str(arg) for arg in args],
+        capture_output=True,
+        text=True,
+        timeout=60
+    )
+
+
+@pytest.fixture
+def orphan_graph(tmp_path) -> Path:
+    """Graph whose first check (orphans) already reports 3 critical issues"""
+    return write_graph(tmp_path / "orphans.json", ["a", "b", "c", "d", "e"], [("d", "e")])
+
+
+class TestMaxCritical:
+    """--max-critical stops after the check that reaches the limit"""
+
+    def test_stops_early(self, orphan_graph):
+        _, results = validate(orphan_graph, max_critical=1)
+        assert results["stopped_early"] is True
+        assert list(results["validation_results"]) == ["orphaned_nodes"]
+        assert results["summary"]["status"] == "FAIL"
+
+    def test_limit_not_reached_runs_all_checks(self, orphan_graph):
+        _, results = validate(orphan_graph, max_critical=100)
+        assert "stopped_early" not in results
+        assert len(results["validation_results"]) == 5
+
+    def test_stopped_run_never_passes(self, orphan_graph):
+        validator = ArchitectureValidator(orphan_graph, max_critical=1)
+        validator.stopped_early = True
+        assert validator.generate_summary()["status"] == "FAIL"
+
+    def test_cli_stops_early(self, orphan_graph):
+        result = run_validator([orphan_graph, "--format", "json", "--max-critical", "1"])
+        assert result.returncode == 1
+        data = json.loads(result.stdout)
+        assert data["stopped_early"] is True
+        assert data["summary"]["status"] == "FAIL"
+
+    @pytest.mark.parametrize("value", ["0", "-1", "x"])
+    def test_cli_rejects_invalid_limit(self, orphan_graph, value):
+        result = run_validator([orphan_graph, f"--max-critical={value}"])
+        assert result.returncode == 2
+        assert "--max-critical" in result.stderr
+
+    def test_constructor_rejects_invalid_limit(self, orphan_graph):
+        with pytest.raises(ValueError):
+            ArchitectureValidator(orphan_graph, max_critical=0)
+
+
+# ============================================================================
+# Results Cache
+# ============================================================================
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch) -> Path:
+    """Point the validator's cache at a temporary directory"""
+    directory = tmp_path / "cache"
+    monkeypatch.setattr(validate_merged_architecture, "CACHE_DIR", directory)
+    return directory
+
+
+class TestResultsCache:
+    """--cache reuses results for a graph file with the same contents"""
+
+    def test_hit_returns_same_results(self, tmp_path, cache_dir, orphan_graph):
+        _, first = validate(orphan_graph, use_cache=True)
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+        copy = tmp_path / "copy.json"
+        copy.write_bytes(orphan_graph.read_bytes())
+        validator, second = validate(copy, use_cache=True)
+        assert validator.nodes == {}  # Served from the cache, graph never loaded
+        assert second["graph_file"] == str(copy)
+        for key in ("validation_results", "issues", "summary", "total_nodes"):
+            assert second[key] == first[key]
+
+    def test_edited_graph_misses(self, cache_dir, orphan_graph):
+        _, first = validate(orphan_graph, use_cache=True)
+        write_graph(orphan_graph, ["a", "b"], [("a", "b")])
+        validator, second = validate(orphan_graph, use_cache=True)
+        assert validator.nodes != {}
+        assert second["total_nodes"] == 2
+        assert second["summary"] != first["summary"]
+        assert len(list(cache_dir.glob("*.json"))) == 2
+
+    def test_disabled_by_default(self, cache_dir, orphan_graph):
+        validate(orphan_graph)
+        assert not cache_dir.exists()
+
+    def test_max_critical_bypasses_cache(self, cache_dir, orphan_graph):
+        validate(orphan_graph, use_cache=True)
+        _, results = validate(orphan_graph, use_cache=True, max_critical=1)
+        assert results["stopped_early"] is True
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+    def test_prune_keeps_max_entries(self, tmp_path, cache_dir, monkeypatch):
+        monkeypatch.setattr(validate_merged_architecture, "CACHE_MAX_ENTRIES", 2)
+        for i in range(4):
+            graph = write_graph(tmp_path / f"g{i}.json", [f"n{i}", "x"], [(f"n{i}", "x")])
+            validate(graph, use_cache=True)
+        assert len(list(cache_dir.glob("*.json"))) == 2